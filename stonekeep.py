@@ -8,12 +8,23 @@ Supported:
 - (GOG) Stonekeep save files (*.SAV)
 
 """
+import mmap
 import os
-from enum import Enum, auto
+import re
+import sys
+from enum import IntEnum, auto
 from pathlib import Path
 
 version = "1.0"
-banner = f"""
+
+def _make_banner() -> str:
+    """
+    Builds the title banner shown when the editor starts.
+
+    Kept out of module scope so importing stonekeep for its helpers does not
+    build the banner.
+    """
+    return f"""
 
  ____  _                   _                             
 / ___|| |_ ___  _ __   ___| | _____  ___ _ __            
@@ -27,11 +38,14 @@ banner = f"""
  \____|\__,_|_| |_| |_|\___| |_____\__,_|_|\__\___/|_|   
 Version:{version}
 """
+
 # Enums
-class character_name(Enum):
+class character_name(IntEnum):
     """
     Enumeration of playable characters in the Stonekeep save file.
 
+    Members are ints, so table lookups keyed on them use plain int hashing.
+
     Members:
         Drake: The default main character.
         Farley: A secondary or companion character.
@@ -39,7 +53,7 @@ class character_name(Enum):
     Drake = auto()
     Farley = auto()
 
-class attributes(Enum):
+class attributes(IntEnum):
     """
     Enumeration of editable character attributes.
 
@@ -77,6 +91,27 @@ OFFSETS = {
     }
 }
 
+# Flattened view of OFFSETS and ATTRIBUTE_VALUES, built once at import time so
+# the edit menu can resolve a character-attribute pair with a single lookup.
+#   (character_name, attributes) -> (offset, value)
+EDIT_TABLE = {
+    (character, attribute): (offset, ATTRIBUTE_VALUES[attribute])
+    for character, character_offsets in OFFSETS.items()
+    for attribute, offset in character_offsets.items()
+}
+
+# Menu text, built once and printed on every menu draw.
+MAIN_MENU_STR = "Select your Character:\n[1] Drake\n[2] Farely\n[0] Exit"
+EDIT_MENU_STR = "What would you like to modify?\n[1] Health\n[0] Back"
+
+# Status messages reported by binary_write after each edit.
+_WROTE_TMPL = "\nWrote value:%d to offset:%d\n\n"
+_ALREADY_SET_TMPL = "\nValue:%d already set at offset:%d\n\n"
+
+# Edits waiting to be flushed from the mapping back to disk, as (offset, value)
+# pairs. They are written out together on "Back"/"Exit" transitions.
+pending: list[tuple[int,int]] = []
+
 class game_character:
     """
     Represents a playable character and their currently selected attribute.
@@ -101,57 +136,87 @@ class game_character:
         self.attributes = attributes
 
 
-def binary_write(value:int,max_value:int,offset:int,file_path:str):
+def binary_write(value:int,max_value:int,offset:int,mm:mmap.mmap):
     """
-    Writes an integer value to the binary save file at a specified offset.
+    Writes an integer value to the memory-mapped save file at a specified offset.
 
-   This function opens the file in read+write binary mode and write the
-   given 'value' at the specified byte offset.
+   The save file is mapped once in main(), so each edit is a single store into
+   the mapping. The edit is queued in `pending` and written back to disk by
+   `flush_pending()`. If the byte already holds 'value', nothing is written.
 
    Args:
         value (int): The integer value to write (mustbe within 0 and max_value).
         max_value (int): The maximum allowed value for the input.
         offset (int): The byte offset in the file where the value will be written.
-        file_path (str): Path to the binary file.
+        mm (mmap.mmap): Writable memory map of the save file.
     
     Raises:
-        ValueError: If offset is negative or value exceeds max_value.
-        FileNotFoundError: If the file does not exist.
-        OSError: If there is a problem accessing or writing to the file.
+        ValueError: If offset is outside the file or value exceeds max_value.
     """
     try:
-        if offset < 0:
-            raise ValueError("Offset must be non-negitive")
+        if not(0 <= offset < len(mm)):
+            raise ValueError(f"Offset:{offset} is outside the file [size]:{len(mm)} bytes")
         if not(0 <= value <=max_value):
             raise ValueError(f"Value must no exceed max value:{max_value}")
-        
-        with open(file_path,"rb+") as f:
-            # move to the end to get file size
-            f.seek(0,2)
-            file_size = f.tell()
 
-            if offset >= file_size:
-                raise ValueError(f"Offset:{offset} is beyound end of file [size]:{file_size} bytes")
+        # Leave the page clean if the byte already holds the value
+        if mm[offset] == value:
+            sys.stdout.write(_ALREADY_SET_TMPL % (value, offset))
+            return
 
-            # Write value to offset
-            f.seek(offset)
-            f.write(bytes([value]))
-            f.close()
-            print(f"\nWrote value:{value} to offset:{offset}\n")
+        # Write value to offset
+        mm[offset] = value
+        pending.append((offset, value))
+        sys.stdout.write(_WROTE_TMPL % (value, offset))
 
-    except FileNotFoundError:
-        print(f"File not found: {file_path}")
     except ValueError as err:
         print(f"Value Error: {err}")
-    except OSError as err:
-        print(f"OS Error: {err}")
     
+def validate_offsets(file_size:int):
+    """
+    Removes edits whose offsets fall outside the loaded save file.
+
+    Runs once after the save file is opened so that any entry in EDIT_TABLE
+    pointing past the end of the file (such as placeholder offsets) is never
+    offered for editing.
+
+    Args:
+        file_size (int): Size of the loaded save file in bytes.
+    """
+    for key, (offset, _) in list(EDIT_TABLE.items()):
+        if offset >= file_size:
+            character, attribute = key
+            print(f"Skipping {character.name} {attribute.name}: offset:{offset} is beyond end of file [size]:{file_size} bytes")
+            del EDIT_TABLE[key]
+
+def flush_pending(mm:mmap.mmap):
+    """
+    Flushes all queued edits from the memory map back to the save file.
+
+    The dirty region is widened to page boundaries and written back with a
+    single flush call, then the queue is cleared.
+
+    Args:
+        mm (mmap.mmap): Writable memory map of the save file.
+    """
+    if not pending:
+        return
+    pending.sort()
+    start = pending[0][0] - (pending[0][0] % mmap.ALLOCATIONGRANULARITY)
+    end = pending[-1][0] + 1
+    mm.flush(start, end - start)
+    pending.clear()
+
+# Matches a dragged-and-dropped path: optional whitespace, an optional
+# PowerShell '& ' prefix (as seen in vs code), and optional surrounding quotes.
+_PATH_RE = re.compile(r'^\s*(?:&\s+)?["\']?(.*?)["\']?\s*$')
+
 def clean_file_path(raw_path:str) -> Path:
     """
     Cleans a raw file path string for safe use with a Path object.
 
     This function removes leading and trailing whitespace, any PowerShell-style
-    prefix '& ', and surrounding single or double qoutes.
+    prefix '& ', and surrounding single or double qoutes in a single regex pass.
 
     Args:
         raw_path (str): The raw file path string
@@ -159,128 +224,123 @@ def clean_file_path(raw_path:str) -> Path:
     Returns:
         Path: A sanitized and normalized Path object.
     """
-    cleaned = raw_path.strip()
-    if cleaned.startswith("& "):
-        cleaned = cleaned[2:] # remove & [space]; As seen in vs code
-    cleaned = cleaned.strip('"').strip("'")
-    return Path(cleaned)
+    match = _PATH_RE.match(raw_path)
+    return Path(match.group(1) if match else raw_path)
 
-def clear_screen():
+def enable_ansi():
     """
-    Clears the terminal screen based on the operating system
+    Enables ANSI escape sequence handling in the terminal.
 
-    Uses the 'cls' command on Windows and 'clear' on posix systems
+    Windows consoles only interpret ANSI sequences once virtual terminal
+    processing is switched on; running an empty command does this for the
+    current console. POSIX terminals support them already.
     """
     if os.name == 'nt':
-        os.system('cls')
-    else:
-        os.system('clear')
+        os.system('')
 
-def edit_menu(character:game_character,file_path):
+def clear_screen():
+    """
+    Clears the terminal screen using an ANSI escape sequence
+
+    Erases the display and moves the cursor to the top-left corner without
+    spawning a shell. Requires `enable_ansi()` to have been called on Windows.
+    """
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
+
+def edit_menu(character:game_character,mm:mmap.mmap):
     """
     Displays the attribute editing menu for a selected game character.
 
     Prompts the user to choose which attribute to modify (e.g., Health).
     Based on the selection, it looks up the corresponding offset and value,
-    and writes the value directly into the provided save file.
+    and writes the value directly into the mapped save file.
 
     If the user selects "Back", control returns to the main menu.
     Invalid inputs re-display the menu.
 
-    This function loops recursively to allow continuous editing.
+    This function loops until "Back" is selected to allow continuous editing.
 
     Args:
         character (game_character): The character whose attributes will be modified.
-        file_path (Path or str): The path to the Stonekeep save file to be edited.
+        mm (mmap.mmap): Writable memory map of the Stonekeep save file.
     """
-    # Availible editing options
-    options = {        
-        "1": "Health",
-        "0": "Back"
-    }
-    # Display options to the user
-    print(f"What would you like to modify?")
-    for key, value in options.items():
-        print(f"[{key}] {value}")
-    
-    # Get and sanitize user input
-    choice = input("> ").strip().lower()
-
-    # Handle user input
-    match choice:
-        case "0":
-            # Choice was to go back
-            clear_screen()
-            main_menu(file_path)
-        case "1":
-            # User selected Health to modify
-            character.attributes = attributes.health
-        case _:
-            # Invalid input, redisplay options
-            edit_menu(character,file_path)
-    
-    # Look up the offset and value related to the character
-    offset = OFFSETS[character.name][character.attributes]
-    value = ATTRIBUTE_VALUES[character.attributes]
-    
-    # Write values to .SAV file
-    binary_write(value, 255, offset, str(file_path))
-
-    # Return to edit menu 
-    edit_menu(character,file_path)
+    while True:
+        # Display options to the user
+        print(EDIT_MENU_STR)
+        
+        # Get and sanitize user input
+        choice = input("> ").strip().lower()
+
+        # Handle user input
+        match choice:
+            case "0":
+                # Choice was to go back
+                flush_pending(mm)
+                clear_screen()
+                return
+            case "1":
+                # User selected Health to modify
+                character.attributes = attributes.health
+            case _:
+                # Invalid input, redisplay options
+                continue
+        
+        # Look up the offset and value related to the character
+        edit = EDIT_TABLE.get((character.name, character.attributes))
+        if edit is None:
+            print(f"\n{character.attributes.name.capitalize()} is not available for {character.name.name}\n")
+            continue
+        offset, value = edit
+        
+        # Write values to .SAV file
+        binary_write(value, 255, offset, mm)
 
 
-def main_menu(file_path:Path):
+def main_menu(mm:mmap.mmap):
     """
     Displays the main menu for character selection and proceeds to attribute editing.
 
     This function prompts the user to choose a character from a predefined list.
     Based on the selection, a `game_character` instance is populated with the corresponding
     character enum value. The function then calls `edit_menu()` to allow editing attributes
-    for the selected character.
+    for the selected character, and re-displays the menu once editing returns.
 
     If the user selects an invalid option, the menu is re-displayed.
-    Selecting "Exit" cleanly terminates the program.
+    Selecting "Exit" flushes pending edits to disk and returns to the caller.
 
     Args:
-        file_path (Path): The path to the Stonekeep save game file to be modified.
+        mm (mmap.mmap): Writable memory map of the Stonekeep save game file.
     """
     # Create a new game_character
     character = game_character()
     
-    # Availible characters to display at main_menu
-    options = {
-        "1": "Drake",
-        "2": "Farely",
-        "0": "Exit"
-    }
-    
-    # Display characters menu
-    print("Select your Character:")
-    for key, value in options.items():
-        print(f"[{key}] {value}")
-    
-    # Normalizing user input
-    choice = input("> ").strip().lower()
-
-    # Handling menu selection
-    match choice:
-        case "0":
-            print("\nBYE!!\n")
-            quit(0)
-        case "1":
-            # User selected Drake
-            character.name = character_name.Drake
-        case "2":
-            # User selected Farley
-            character.name = character_name.Farley            
-        case _:
-            # Invalid input, redisplay the input
-            print("\nSelection not found\n")
-            main_menu(file_path)
-
-    # Edit attribute for selected user    
-    edit_menu(character,file_path)
+    while True:
+        # Display characters menu
+        print(MAIN_MENU_STR)
+        
+        # Normalizing user input
+        choice = input("> ").strip().lower()
+
+        # Handling menu selection
+        match choice:
+            case "0":
+                flush_pending(mm)
+                print("\nBYE!!\n")
+                return
+            case "1":
+                # User selected Drake
+                character.name = character_name.Drake
+            case "2":
+                # User selected Farley
+                character.name = character_name.Farley            
+            case _:
+                # Invalid input, redisplay the input
+                print("\nSelection not found\n")
+                continue
+
+        # Edit attribute for selected user    
+        edit_menu(character,mm)
 
 def main():
     """
@@ -288,17 +348,57 @@ def main():
 
     Clears the terminal screen, displays the banner, and prompts the user
     to drag and drop a Stonekeep save file. The raw file path is sanitized
-    and passed to `main_menu()` for character selection and attribute editing.
+    and the file is opened and memory-mapped once, then passed to `main_menu()`
+    for character selection and attribute editing. The descriptor is closed when
+    the session ends.
     
     """
+    enable_ansi()
     clear_screen()
-    print(banner)
+    print(_make_banner())
     raw_path = input("Drag and drop a save file here, then press Enter:\n")
     # sanitize the file_path
     file_path = clean_file_path(raw_path)
-    clear_screen()
-    main_menu(file_path)
 
+    # Open the save file once and keep the descriptor for the whole editing session
+    try:
+        fd = os.open(file_path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:
+        print(f"File not found: {file_path}")
+        return
+    except OSError as err:
+        print(f"OS Error: {err}")
+        return
+
+    # Size the file once; an empty file cannot be mapped or edited
+    file_size = os.fstat(fd).st_size
+    if file_size == 0:
+        print(f"Save file is empty: {file_path}")
+        os.close(fd)
+        return
+
+    try:
+        mm = mmap.mmap(fd, file_size, access=mmap.ACCESS_WRITE)
+    except (OSError, ValueError) as err:
+        print(f"Unable to map save file: {err}")
+        os.close(fd)
+        return
+
+    # Edits touch a few scattered bytes, so ask the kernel not to read ahead
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_RANDOM)
+    if hasattr(mmap, "MADV_RANDOM"):
+        mm.madvise(mmap.MADV_RANDOM)
+
+    try:
+        clear_screen()
+        validate_offsets(file_size)
+        main_menu(mm)
+    finally:
+        # Persist any edits and release the mapping and descriptor
+        flush_pending(mm)
+        mm.close()
+        os.close(fd)
 
 
 if __name__ == "__main__":